@@ -1,4 +1,10 @@
 import os
+import time
+import asyncio
+import threading
+from collections import Counter
+from typing import Any, Mapping
+from pydantic import PrivateAttr
 from AzureConnection import AzureConnection
 from langchain_openai import AzureChatOpenAI
 from langchain.chains import (
@@ -11,6 +17,8 @@ from langchain.prompts import PromptTemplate
 from langchain.chains.router import MultiPromptRouter
 from langchain.chains.router.llm_router import LLMRouterChain
 from langchain.chains.router.prompt import RouterPromptTemplate
+from langchain.chains.base import Chain
+from langchain.callbacks.base import AsyncCallbackHandler
 from langchain.memory import ConversationBufferMemory
 
 # Import model configuration from langchain_utils.py
@@ -48,7 +56,226 @@ def setup_llm():
     llm = CustomAzureChatOpenAI(**MODEL_CONFIG)
     return llm
 
-def demonstrate_router_chain():
+# Event loop shared by all speculative routers
+speculation_loop = None
+_speculation_loop_lock = threading.Lock()
+
+def get_speculation_loop():
+    """Get the event loop speculative routers run on, starting it on first use
+
+    The loop is never stopped and is shared across routers: async LLM clients
+    keep connections bound to the loop that opened them, so it must outlive
+    every call made through any router sharing those clients.
+    """
+    global speculation_loop
+    with _speculation_loop_lock:
+        if speculation_loop is None:
+            speculation_loop = asyncio.new_event_loop()
+            threading.Thread(target=speculation_loop.run_forever, daemon=True).start()
+    return speculation_loop
+
+class _SpeculationTracker(AsyncCallbackHandler):
+    """Record what a speculative call has sent and received so far"""
+
+    def __init__(self):
+        self.prompts = []
+        self.tokens_received = 0
+        self.usage_tokens = None
+
+    async def on_llm_start(self, serialized, prompts, **kwargs):
+        self.prompts.extend(prompts)
+
+    async def on_llm_new_token(self, token, **kwargs):
+        self.tokens_received += 1
+
+    async def on_llm_end(self, response, **kwargs):
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        if "total_tokens" in token_usage:
+            self.usage_tokens = token_usage["total_tokens"]
+        elif "prompt_tokens" in token_usage or "completion_tokens" in token_usage:
+            self.usage_tokens = (token_usage.get("prompt_tokens", 0)
+                                 + token_usage.get("completion_tokens", 0))
+
+
+class SpeculativeRouter(Chain):
+    """Run the most likely destination chain concurrently with the routing call.
+
+    The guess is the historically most frequent route, or the default chain
+    until any history exists. When the router picks the guessed destination
+    the speculative result is kept; otherwise the speculative task is cancelled
+    and the routed destination runs with the router's inputs.
+
+    LLMRouterChain may rewrite the input it passes on, so a kept result can
+    answer the original input rather than the rewritten one. Set
+    require_same_inputs=True to discard the guess in that case too, at the
+    cost of far fewer hits. Either way it is reported as rewritten_inputs.
+
+    Sync and async callers both submit to the shared speculation loop, so
+    the LLM clients' connection pools are never reused across closed loops.
+    """
+
+    router_chain: RouterChain
+    destination_chains: Mapping[str, Chain]
+    default_chain: Chain
+    silent_errors: bool = False
+    require_same_inputs: bool = False
+
+    _route_counts: Counter = PrivateAttr(default_factory=Counter)
+    _stats: dict = PrivateAttr(default_factory=lambda: {
+        "calls": 0,
+        "hits": 0,
+        "misses": 0,
+        "rewritten_inputs": 0,
+        "latency_saved": 0.0,
+        "wasted_tokens": 0,
+    })
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @classmethod
+    def from_router(cls, router, verbose=False, require_same_inputs=False):
+        """Wrap an existing MultiPromptRouter-style router"""
+        return cls(
+            router_chain=router.router_chain,
+            destination_chains=router.destination_chains,
+            default_chain=router.default_chain,
+            silent_errors=getattr(router, "silent_errors", False),
+            require_same_inputs=require_same_inputs,
+            verbose=verbose
+        )
+
+    @property
+    def input_keys(self):
+        return self.router_chain.input_keys
+
+    @property
+    def output_keys(self):
+        return self.default_chain.output_keys
+
+    def _resolve(self, destination):
+        """Resolve a destination the same way MultiRouteChain does
+
+        Returns the destination name actually used (None for the default
+        chain) together with the chain itself.
+        """
+        if destination is None:
+            return None, self.default_chain
+        if destination in self.destination_chains:
+            return destination, self.destination_chains[destination]
+        if self.silent_errors:
+            return None, self.default_chain
+        raise ValueError(f"Received invalid destination chain name '{destination}'")
+
+    def _predict_destination(self):
+        with self._lock:
+            if self._route_counts:
+                return self._route_counts.most_common(1)[0][0]
+        return None
+
+    def _count_tokens(self, chain, text):
+        """Count tokens with the chain's LLM, falling back to ~4 characters per token"""
+        try:
+            return chain.llm.get_num_tokens(text)
+        except Exception:
+            return max(len(text) // 4, 1) if text else 0
+
+    def _wasted_tokens(self, chain, tracker):
+        """Tokens spent on a discarded speculative call; never raises"""
+        try:
+            if tracker.usage_tokens is not None:
+                return tracker.usage_tokens
+            # Cancelled before the completion ended: estimate what was sent and streamed
+            prompt_tokens = self._count_tokens(chain, "\n".join(tracker.prompts))
+            return prompt_tokens + tracker.tokens_received
+        except Exception:
+            return 0
+
+    async def _ainvoke_timed(self, chain, inputs, callbacks):
+        start = time.perf_counter()
+        outputs = await chain.ainvoke(inputs, config={"callbacks": callbacks})
+        return outputs, time.perf_counter() - start
+
+    async def _aroute_and_run(self, inputs, callbacks):
+        guess = self._predict_destination()
+        guess, guess_chain = self._resolve(guess)
+        tracker = _SpeculationTracker()
+        if callbacks is None:
+            speculative_callbacks = [tracker]
+        else:
+            speculative_callbacks = callbacks.copy()
+            speculative_callbacks.add_handler(tracker)
+
+        start = time.perf_counter()
+        task = asyncio.create_task(
+            self._ainvoke_timed(guess_chain, inputs, speculative_callbacks)
+        )
+        # A discarded guess may still fail; retrieve its exception so it isn't logged
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        try:
+            route = await self.router_chain.aroute(inputs, callbacks=callbacks)
+            route_time = time.perf_counter() - start
+            destination, chain = self._resolve(route.destination)
+            rewritten = chain is guess_chain and route.next_inputs != inputs
+
+            if chain is guess_chain and not (rewritten and self.require_same_inputs):
+                outputs, chain_time = await task
+                hit = True
+                wasted = 0
+            else:
+                task.cancel()
+                wasted = self._wasted_tokens(guess_chain, tracker)
+                outputs, chain_time = await self._ainvoke_timed(
+                    chain, route.next_inputs, callbacks
+                )
+                hit = False
+        finally:
+            if not task.done():
+                task.cancel()
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["hits" if hit else "misses"] += 1
+            self._stats["rewritten_inputs"] += int(rewritten)
+            # Without speculation the call would have taken route_time + chain_time
+            self._stats["latency_saved"] += route_time + chain_time - elapsed
+            self._stats["wasted_tokens"] += wasted
+            self._route_counts[destination] += 1
+
+        if self.verbose:
+            print(f"Speculated: {guess or 'default'}, routed: {destination or 'default'} "
+                  f"({'hit' if hit else 'miss'}{', inputs rewritten' if rewritten else ''})")
+        return outputs
+
+    async def _acall(self, inputs, run_manager=None):
+        callbacks = run_manager.get_child() if run_manager else None
+        future = asyncio.run_coroutine_threadsafe(
+            self._aroute_and_run(inputs, callbacks), get_speculation_loop()
+        )
+        return await asyncio.wrap_future(future)
+
+    def _call(self, inputs, run_manager=None):
+        callbacks = run_manager.get_child() if run_manager else None
+        future = asyncio.run_coroutine_threadsafe(
+            self._aroute_and_run(inputs, callbacks), get_speculation_loop()
+        )
+        return future.result()
+
+    def get_stats(self):
+        """Return hit rate, latency saved and wasted tokens so far"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["hit_rate"] = stats["hits"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
+
+    def print_stats(self):
+        """Print a summary of speculation results"""
+        stats = self.get_stats()
+        print(f"Speculation hit rate: {stats['hit_rate']:.0%} ({stats['hits']}/{stats['calls']})")
+        print(f"Destination hits with rewritten inputs: {stats['rewritten_inputs']}")
+        print(f"Latency saved: {stats['latency_saved']:.2f}s")
+        print(f"Wasted tokens: {stats['wasted_tokens']}")
+
+def demonstrate_router_chain(speculative=False):
     """Demonstrate Router Chain usage"""
     print("\n=== Router Chain Examples ===")
     
@@ -100,6 +327,9 @@ def demonstrate_router_chain():
         verbose=True
     )
     
+    if speculative:
+        router = SpeculativeRouter.from_router(router, verbose=True)
+    
     # Test the router chain
     print("\nExample 1: Python Question")
     result1 = router.run("How do I create a list comprehension in Python?")
@@ -113,6 +343,9 @@ def demonstrate_router_chain():
     result3 = router.run("What is the capital of France?")
     print(f"Result: {result3}")
     
+    if speculative:
+        router.print_stats()
+    
     return router
 
 def demonstrate_sequential_chain():
@@ -175,7 +408,7 @@ def demonstrate_sequential_chain():
     result2 = code_explain_chain.run("calculate the factorial of a number")
     print(f"Result: {result2}")
 
-def create_router_chain_examples():
+def create_router_chain_examples(speculative=False):
     """Create reusable Router Chain examples"""
     
     llm = setup_llm()
@@ -218,7 +451,7 @@ def create_router_chain_examples():
         simple_chain = LLMChain(llm=llm, prompt=simple_template)
         creative_chain = LLMChain(llm=llm, prompt=creative_template)
         
-        return MultiPromptRouter(
+        router = MultiPromptRouter(
             router_chain=router_chain,
             destination_chains={
                 "technical": technical_chain,
@@ -228,6 +461,10 @@ def create_router_chain_examples():
             default_chain=simple_chain,
             verbose=False
         )
+        
+        if speculative:
+            return SpeculativeRouter.from_router(router)
+        return router
     
     return {
         "content_router": create_content_router()